@@ -16,14 +16,16 @@ INSTALL:
 TO RUN:
 Save the following as a python shelf button and add the scalist_icon for maximum performance.
 
-import scale_keys
-reload(scale_keys)
-scale_keys
+import scalist
+scalist.show()
 
 #######################################################################
 
 """
 
+from functools import partial
+
+import maya.cmds as cmds
 import pymel.core as pm
 
 __author__ = 'Eric Luhta'
@@ -34,37 +36,76 @@ __author__ = 'Eric Luhta'
 ########################################################################
 
 class Scalist(object):
+    # Pivots worked out from each curve's own keys in the multi operations, the rest are the same for every curve
+    PER_CURVE = frozenset(['pivot_first_value', 'pivot_highest_value', 'pivot_lowest_value', 'pivot_middle_value',
+                           'pivot_first_time', 'pivot_last_time', 'pivot_flip_curve_value', 'pivot_ramped_value'])
+
     def __init__(self, pivot, user_scale, scale_type):
         self.pivot = pivot
         self.scale = user_scale.getValue()
-        self.curves = pm.keyframe(query=True, selected=True, name=True)
-        self.key_values = pm.keyframe(query=True, selected=True, valueChange=True, absolute=True)
-        self.key_times = pm.keyframe(query=True, selected=True, timeChange=True, absolute=True)
         self.scale_type = scale_type
 
+        if pivot not in Scalist._PIVOT_DISPATCH:
+            raise ValueError('[scalist.py] Unknown pivot: %s' % pivot)
+        if scale_type not in Scalist._SCALE_DISPATCH:
+            raise ValueError('[scalist.py] Unknown scale type: %s' % scale_type)
+
+        # Resolve the pivot and scale functions up front so the multi loops don't look them up per curve
+        self._pivot_func = Scalist._PIVOT_DISPATCH[pivot]
+        self._scale_func = Scalist._SCALE_DISPATCH[scale_type]
+
+        # Pivots outside PER_CURVE are the same for every curve, so they're kept after the first time
+        self._shared_pivot = None
+
+        # Per-curve (times, values) queries, filled in as the multi operations ask for them
+        self._key_cache = {}
+
+        # Selection queries are left until a pivot or scale operation first needs them
+        self._curves = None
+        self.key_times = None
+        self.key_values = None
+
+    @property
+    def curves(self):
+        if self._curves is None:
+            self._curves = self.get_curves()
+        return self._curves
+
+    @property
+    def key_times(self):
+        if self._key_times is None:
+            self.key_times, self.key_values = self.get_selected_keys()
+        return self._key_times
+
+    @key_times.setter
+    def key_times(self, times):
+        # New keys mean the cached range no longer applies
+        self._key_times = times
+        self._time_range = None
+
+    @property
+    def key_values(self):
+        if self._key_values is None:
+            self.key_times, self.key_values = self.get_selected_keys()
+        return self._key_values
+
+    @key_values.setter
+    def key_values(self, values):
+        # New keys mean the cached range no longer applies
+        self._key_values = values
+        self._value_range = None
+
     #####################################################################
     # Pivot functions
 
     def get_pivot(self):
-        """Returns the right function to determine the pivot based on a dictionary argument"""
-        switcher = {'pivot_zero_value': self.pivot_zero_value,
-                    'pivot_highest_value': self.pivot_highest_value,
-                    'pivot_lowest_value': self.pivot_lowest_value,
-                    'pivot_middle_value': self.pivot_middle_value,
-                    'pivot_last_selected_value': self.pivot_last_selected_value,
-                    'pivot_first_time': self.pivot_first_time,
-                    'pivot_last_time': self.pivot_last_time,
-                    'pivot_current_time': self.pivot_current_time,
-                    'pivot_last_selected_time': self.pivot_last_selected_time,
-                    'pivot_flip_curve_value': self.pivot_flip_curve_value,
-                    'pivot_first_value': self.pivot_first_value,
-                    'pivot_ramped_value': self.pivot_ramped_value,
-                    'pivot_flip_zero_value': self.pivot_flip_zero_value
-                    }
-
-        # Get the function from the switcher dictionary
-        func = switcher.get(self.pivot)
-        return func()
+        """Returns the pivot from the function matching the pivot name in the dispatch table"""
+        if self.pivot in Scalist.PER_CURVE:
+            return self._pivot_func(self)
+
+        if self._shared_pivot is None:
+            self._shared_pivot = self._pivot_func(self)
+        return self._shared_pivot
 
     def pivot_zero_value(self):
         """Returns 0 for using it as a pivot point"""
@@ -72,40 +113,41 @@ class Scalist(object):
 
     def pivot_highest_value(self):
         """Returns the value of the highest keyframe in the active selection"""
-        return max(self.key_values)
+        return self.get_value_range()[1]
 
     def pivot_lowest_value(self):
         """Returns the value of the lowest keyframe in the active selection"""
-        return min(self.key_values)
+        return self.get_value_range()[0]
 
     def pivot_middle_value(self):
         """Returns the middle value of the current active selection"""
-        return ((max(self.key_values) + min(self.key_values)) / 2)
+        lowest, highest = self.get_value_range()
+        return (highest + lowest) / 2
 
     def pivot_last_selected_value(self):
         """Returns the value of the last selected key"""
-        pivot = pm.keyframe(query=True, lastSelected=True, valueChange=True)
+        pivot = cmds.keyframe(query=True, lastSelected=True, valueChange=True)
 
-        # Pymel returns a set with lastSelected flag, so make sure it only sends the value
+        # keyframe returns a list even with the lastSelected flag, so make sure it only sends the value
         return pivot[0]
 
     def pivot_first_time(self):
         """Returns the first key time of the active selection"""
-        return min(self.key_times)
+        return self.get_time_range()[0]
 
     def pivot_last_time(self):
         """Returns the last key time of the active selection"""
-        return max(self.key_times)
+        return self.get_time_range()[1]
 
     def pivot_current_time(self):
         """Returns the current frame"""
-        return pm.currentTime(query=True)
+        return cmds.currentTime(query=True)
 
     def pivot_last_selected_time(self):
         """Returns the time of the last selected keyframe"""
-        pivot = pm.keyframe(query=True, lastSelected=True, timeChange=True)
+        pivot = cmds.keyframe(query=True, lastSelected=True, timeChange=True)
 
-        # Pymel returns a set with lastSelected flag, so make sure it only sends the value
+        # keyframe returns a list even with the lastSelected flag, so make sure it only sends the value
         return pivot[0]
 
     def pivot_first_value(self):
@@ -114,8 +156,9 @@ class Scalist(object):
 
     def pivot_flip_curve_value(self):
         """Sets scale to -1 and returns middle value to invert selected curves"""
+        lowest, highest = self.get_value_range()
         self.scale = -1
-        return self.pivot_middle_value()
+        return (highest + lowest) / 2
 
     def pivot_flip_zero_value(self):
         """Sets scale to -1 and returns zero to flip curves over 0"""
@@ -123,15 +166,31 @@ class Scalist(object):
         return self.pivot_zero_value()
 
     def pivot_ramped_value(self):
-        """Scales gradually over the selected range"""
-        pass
+        """Returns the value of the first key in each curve, where the ramp starts from"""
+        return self.key_values[0]
+
+    # Built once with the class so a scale operation doesn't rebuild a dict of bound methods
+    _PIVOT_DISPATCH = {'pivot_zero_value': pivot_zero_value,
+                       'pivot_highest_value': pivot_highest_value,
+                       'pivot_lowest_value': pivot_lowest_value,
+                       'pivot_middle_value': pivot_middle_value,
+                       'pivot_last_selected_value': pivot_last_selected_value,
+                       'pivot_first_time': pivot_first_time,
+                       'pivot_last_time': pivot_last_time,
+                       'pivot_current_time': pivot_current_time,
+                       'pivot_last_selected_time': pivot_last_selected_time,
+                       'pivot_flip_curve_value': pivot_flip_curve_value,
+                       'pivot_first_value': pivot_first_value,
+                       'pivot_ramped_value': pivot_ramped_value,
+                       'pivot_flip_zero_value': pivot_flip_zero_value
+                       }
 
     #############################################################################
     # Scale functions
 
     def scale_keys_value(self):
         """Scales all selected keys in value from a single pivot for all"""
-        pm.scaleKey(valuePivot=self.get_pivot(), valueScale=self.scale)
+        cmds.scaleKey(valuePivot=self.get_pivot(), valueScale=self.scale)
 
     def scale_keys_value_multi(self):
         """Scales each selected curve's keys independently on their own pivots"""
@@ -142,15 +201,15 @@ class Scalist(object):
             self.key_times = self.get_key_times(curve)
             pivot = self.get_pivot()
 
-            for i in xrange(len(self.key_values)):
-                pm.scaleKey(curve, valuePivot=pivot, valueScale=self.scale, time=(self.key_times[i], self.key_times[i]))
+            # time is a multi-use flag, so a single call scales just the selected keys of this curve
+            cmds.scaleKey(curve, valuePivot=pivot, valueScale=self.scale, time=[(t, t) for t in self.key_times])
 
     def scale_keys_time(self):
         """Scales all selected keys in time from a single pivot for all"""
-        pm.scaleKey(timePivot=(self.get_pivot()), timeScale=self.scale)
+        cmds.scaleKey(timePivot=(self.get_pivot()), timeScale=self.scale)
 
         # Snap all keys so there are no subframe keys
-        pm.snapKey(tm=1.0)
+        cmds.snapKey(tm=1.0)
 
     def scale_keys_time_multi(self):
         """Scales each selected curve's keys independently in time on their own pivots"""
@@ -158,43 +217,87 @@ class Scalist(object):
         for curve in self.curves:
             self.key_times = self.get_key_times(curve)
 
-            # if we're scaling time from the last key, we need to iterate backwards through the scaling or some values
-            # will give weird results as the first keys end up after ones not yet scaled
-            if self.pivot == 'pivot_last_time':
-                key_range = reversed(xrange(len(self.key_times)))
-            else:
-                key_range = xrange(len(self.key_times))
+            # The pivot comes from the keys' starting times, so it stays the same while they are moved
+            pivot = self.get_pivot()
+
+            # scaling the curve's selected keys together in one call means none of them can be moved past
+            # keys that haven't been scaled yet, whichever end the pivot is at
+            cmds.scaleKey(curve, timePivot=pivot, timeScale=self.scale, time=[(t, t) for t in self.key_times])
+
+        # Snap all keys once every curve has been scaled so there are no subframe keys
+        cmds.snapKey(tm=1.0)
+
+    def scale_keys_value_ramped(self):
+        """Scales each selected curve's keys on their own pivots, ramping up to the full amount at the last key"""
+
+        for curve in self.curves:
+            self.key_values = self.get_key_values(curve)
+            self.key_times = self.get_key_times(curve)
+            pivot = self.get_pivot()
 
-            for i in key_range:
-                pm.scaleKey(curve, timePivot=(self.get_pivot()), timeScale=self.scale, time=(self.key_times[i], self.key_times[i]))
+            # every key gets its own amount, so they can't share a single scaleKey call
+            for time, scale in zip(self.key_times, self.get_ramp_scales()):
+                cmds.scaleKey(curve, valuePivot=pivot, valueScale=scale, time=(time, time))
 
-            pm.snapKey(tm=1.0)
+    _SCALE_DISPATCH = {'scale_keys_value': scale_keys_value,
+                       'scale_keys_value_multi': scale_keys_value_multi,
+                       'scale_keys_time': scale_keys_time,
+                       'scale_keys_time_multi': scale_keys_time_multi,
+                       'scale_keys_value_ramped': scale_keys_value_ramped}
 
     ##########################################################################
     # Helper functions
 
     def get_scale_type(self):
         """For the UI, a switcher to pick the appropriate type of scaling based on a passed value"""
+        return self._scale_func(self)
 
-        scale_operations = {'scale_keys_value': self.scale_keys_value,
-                            'scale_keys_value_multi': self.scale_keys_value_multi,
-                            'scale_keys_time': self.scale_keys_time,
-                            'scale_keys_time_multi': self.scale_keys_time_multi}
+    def get_value_range(self):
+        """Get the lowest and highest of the current key values, only working them out once per set of keys"""
+        if self._value_range is None:
+            self._value_range = (min(self.key_values), max(self.key_values))
+        return self._value_range
 
-        func = scale_operations.get(self.scale_type)
-        return func()
+    def get_time_range(self):
+        """Get the first and last of the current key times, only working them out once per set of keys"""
+        if self._time_range is None:
+            self._time_range = (min(self.key_times), max(self.key_times))
+        return self._time_range
+
+    def get_ramp_scales(self):
+        """Get a scale for each current key, going evenly in time from 1 at the first key to the full scale"""
+        first, last = self.get_time_range()
+        if first == last:
+            return [self.scale] * len(self.key_times)
+
+        step = (self.scale - 1) / (last - first)
+        return [1 + (time - first) * step for time in self.key_times]
 
     def get_curves(self):
         """Get a list of the names of any selected curves"""
-        return pm.keyframe(query=True, selected=True, name=True)
+        return cmds.keyframe(query=True, selected=True, name=True)
+
+    def get_selected_keys(self):
+        """Get the times and values of every selected key"""
+        # Querying both flags returns the keys as one flat time, value, time, value... list
+        keys = cmds.keyframe(query=True, selected=True, timeChange=True, valueChange=True, absolute=True)
+        return keys[0::2], keys[1::2]
+
+    def get_curve_keys(self, curve):
+        """Get the times and values of an individual curve's selected keys, only querying Maya the first time"""
+        if curve not in self._key_cache:
+            # Querying both flags returns the keys as one flat time, value, time, value... list
+            keys = cmds.keyframe(curve, query=True, selected=True, timeChange=True, valueChange=True, absolute=True)
+            self._key_cache[curve] = (keys[0::2], keys[1::2])
+        return self._key_cache[curve]
 
     def get_key_values(self, curve):
         """Get list of values for an individual curve"""
-        return pm.keyframe(curve, query=True, selected=True, valueChange=True, absolute=True)
+        return self.get_curve_keys(curve)[1]
 
     def get_key_times(self, curve):
         """Get list of times for an individual curve"""
-        return pm.keyframe(curve, query=True, selected=True, timeChange=True, absolute=True)
+        return self.get_curve_keys(curve)[0]
 
 
 #############################################################################
@@ -202,48 +305,141 @@ class Scalist(object):
 
 def check_for_selected_keys(pivot):
     """ Makes sure there are keys selected in the graph editor """
-    selected_keys = pm.keyframe(q=True, sl=True)
+    # keyframeCount gives just the number of keys rather than a list of all their values
+    selected_count = cmds.keyframe(q=True, sl=True, keyframeCount=True)
 
     # a few of the pivots could feasibly be used with just a single keyframe selected so allow those
     single_key_exceptions = ['pivot_zero_value', 'pivot_current_time', 'pivot_flip_zero_value']
 
-    if len(selected_keys) >= 2:
+    if selected_count >= 2:
         return True
-    elif len(selected_keys) > 0 and pivot in single_key_exceptions:
+    elif selected_count > 0 and pivot in single_key_exceptions:
         return True
-    pm.warning('[scalist.py] Please select at least 2 keyframes.'),
+    cmds.warning('[scalist.py] Please select at least 2 keyframes.')
     return False
 
 
-def do_scale(pivot, user_scale, scale_type):
-    """If selection is ok, create an instance and do the scaling"""
+def do_scale(pivot, user_scale, scale_type, *args):
+    """If selection is ok, create an instance and do the scaling, ignoring the args maya passes in"""
     if check_for_selected_keys(pivot):
-        scalist = Scalist(pivot, user_scale, scale_type)
-        scalist.get_scale_type()
+        # scaling by 1 changes nothing, except for the flip pivots which set their own scale of -1
+        flip_pivots = ['pivot_flip_curve_value', 'pivot_flip_zero_value']
+        if abs(user_scale.getValue() - 1.0) < 1e-9 and pivot not in flip_pivots:
+            return
+
+        # keep every scaleKey the operation makes in one undo step
+        cmds.undoInfo(openChunk=True, chunkName='scalist')
+        try:
+            scalist = Scalist(pivot, user_scale, scale_type)
+            scalist.get_scale_type()
+        finally:
+            cmds.undoInfo(closeChunk=True)
 
 
 # UI
 
+# Button and header colors, already converted from 0-255 rgb to the 0.0-1.0 range maya flags take
+_COLOR_YELLOW = (0.906, 0.804, 0.231)
+_COLOR_GREY_L = (0.843, 0.843, 0.843)
+_COLOR_GREY_M = (0.471, 0.471, 0.471)
+_COLOR_GREY_D = (0.176, 0.176, 0.176)
+_COLOR_BLACK = (0.078, 0.078, 0.078)
+
+# Amount preset buttons as (label, amount, color), None keeps maya's default button color
+_PRESET_BUTTONS = (('-1', -1, _COLOR_YELLOW),
+                   ('.25', 0.25, None),
+                   ('.50', 0.5, None),
+                   ('.75', 0.75, None),
+                   ('.90', 0.9, None),
+                   ('reset', 1.0, _COLOR_YELLOW),
+                   ('1.1', 1.1, _COLOR_GREY_L),
+                   ('1.25', 1.25, _COLOR_GREY_L),
+                   ('1.5', 1.5, _COLOR_GREY_L),
+                   ('1.75', 1.75, _COLOR_GREY_L),
+                   ('x2', 2.0, _COLOR_YELLOW))
+
+# Separator flags for the gaps in the pivot button grid
+_DIVIDER = {'style': 'single', 'w': 10}
+_BLANK = {'style': 'none'}
+_GROOVE = {'style': 'in'}
+
+# The pivot button grid in row order, five cells to a row: value buttons, divider, time buttons.
+# Buttons are (label, width, annotation, color, pivot, scale_type)
+_PIVOT_BUTTONS = (
+    ('Mid', 88, 'Scaled from midpoint value of curve', _COLOR_GREY_L, 'pivot_middle_value', 'scale_keys_value'),
+    ('Multi', 89, 'Each curve scaled from its own midpoint', _COLOR_GREY_D,
+     'pivot_middle_value', 'scale_keys_value_multi'),
+    _DIVIDER,
+    ('First', 87, 'Scaled from first frame of selection', _COLOR_GREY_M, 'pivot_first_time', 'scale_keys_time'),
+    ('Multi', 88, 'Each curve scaled from its first frame', _COLOR_GREY_D,
+     'pivot_first_time', 'scale_keys_time_multi'),
+
+    ('Highest', 87, 'Scaled from the highest key value selected', _COLOR_GREY_L,
+     'pivot_highest_value', 'scale_keys_value'),
+    ('Multi', 88, 'Each curve scaled from its highest selected key', _COLOR_GREY_D,
+     'pivot_highest_value', 'scale_keys_value_multi'),
+    _DIVIDER,
+    ('Last', 89, 'Scaled from last frame of selection', _COLOR_GREY_M, 'pivot_last_time', 'scale_keys_time'),
+    ('Multi', 88, 'Each curve scaled from its last frame', _COLOR_GREY_D, 'pivot_last_time', 'scale_keys_time_multi'),
+
+    ('Lowest', 87, 'Scaled from the lowest key value selected', _COLOR_GREY_L,
+     'pivot_lowest_value', 'scale_keys_value'),
+    ('Multi', 88, 'Each curve scaled from its lowest selected key', _COLOR_GREY_D,
+     'pivot_lowest_value', 'scale_keys_value_multi'),
+    _DIVIDER,
+    ('Current', 89, 'Scaled from the current frame in timerange', _COLOR_GREY_M,
+     'pivot_current_time', 'scale_keys_time'),
+    _BLANK,
+
+    ('0', 87, 'Scaled from 0', _COLOR_GREY_L, 'pivot_zero_value', 'scale_keys_value'),
+    ('Ramp', 88, 'Each curve scaled gradually from its first selected key to its last', _COLOR_GREY_D,
+     'pivot_ramped_value', 'scale_keys_value_ramped'),
+    _DIVIDER,
+    ('Last Selected', 89, 'Scaled in time from the last selected key frame', _COLOR_GREY_M,
+     'pivot_last_selected_time', 'scale_keys_time'),
+    _BLANK,
+
+    ('Last Selected', 87, 'Scaled in value from the last selected key', _COLOR_GREY_L,
+     'pivot_last_selected_value', 'scale_keys_value'),
+    _BLANK,
+    _DIVIDER,
+    _GROOVE,
+    _GROOVE,
+
+    ('First', 87, 'Each curve selected from its earliest selected key', _COLOR_GREY_L,
+     'pivot_first_value', 'scale_keys_value_multi'),
+    _BLANK,
+    _DIVIDER,
+    ('Flip Mid', 77, 'Flip each selected curve along its midpoint value', _COLOR_YELLOW,
+     'pivot_flip_curve_value', 'scale_keys_value_multi'),
+    ('Flip 0', 77, 'Flip each selected curve over 0', _COLOR_YELLOW, 'pivot_flip_zero_value', 'scale_keys_value'),
+)
+
+# The window built by this module and its amount slider, so launching again can reuse them
+_window_state = {'user_scale': None, 'built': False}
+
+
 class Window_UI:
     def __init__(self):
-        if pm.window('scalist', exists=True):
-            pm.deleteUI('scalist')
         self.window_id = 'scalist'
 
-    def update_slider(self, ctrl, val):
-        """updates the slider when a scale amount preset button is clicked"""
+    def update_slider(self, ctrl, val, *args):
+        """updates the slider when a scale amount preset button is clicked, ignoring the args maya passes in"""
         pm.floatSliderGrp(ctrl, edit=True, v=val)
 
-    def rgb(self, values):
-        """converts rgb values to 0.0-1.0 for maya flags"""
-        converted = []
-        for val in values:
-            converted.append(round(val / 255.0, 3))
-        return converted
-
     def build_ui(self):
         """builds the ui window"""
 
+        # the window's controls and callbacks are still live if it's already open, so just bring it back up
+        if pm.window(self.window_id, exists=True):
+            if _window_state['built']:
+                self.update_slider(_window_state['user_scale'], 1.0)
+                pm.showWindow(self.window_id)
+                return
+
+            # left over from before a reload, its callbacks point at the old module so build a new one
+            pm.deleteUI(self.window_id)
+
         tool_window = pm.window(self.window_id, title="scalist", width=368, height=295, mnb=True, mxb=True,
                                 sizeable=True)
         main_layout = pm.rowColumnLayout(w=368, h=295)
@@ -255,37 +451,23 @@ class Window_UI:
         # scale amount slider
         user_scale = pm.floatSliderGrp(label='Amount', field=True, precision=2, width=363, minValue=-2.0, maxValue=5.0,
                                        v=1.0, fieldMinValue=-10.0, fieldMaxValue=10.0)
+        _window_state['user_scale'] = user_scale
 
         # scale preset buttons
         btn_layout = pm.rowColumnLayout(nc=11)
 
-        btn_1 = pm.button(label='-1', w=33, bgc=self.rgb([231, 205, 59]),
-                          c=pm.Callback(self.update_slider, user_scale, -1))
-        btn_2 = pm.button(label='.25', w=33, c=pm.Callback(self.update_slider, user_scale, 0.25))
-        btn_3 = pm.button(label='.50', w=33, c=pm.Callback(self.update_slider, user_scale, 0.5))
-        btn_4 = pm.button(label='.75', w=33, c=pm.Callback(self.update_slider, user_scale, 0.75))
-        btn_5 = pm.button(label='.90', w=33, c=pm.Callback(self.update_slider, user_scale, 0.9))
-        btn_6 = pm.button(label='reset', w=33, bgc=self.rgb([231, 205, 59]),
-                          c=pm.Callback(self.update_slider, user_scale, 1.0))
-        btn_7 = pm.button(label='1.1', w=33, bgc=self.rgb([215, 215, 215]),
-                          c=pm.Callback(self.update_slider, user_scale, 1.1))
-        btn_8 = pm.button(label='1.25', w=33, bgc=self.rgb([215, 215, 215]),
-                          c=pm.Callback(self.update_slider, user_scale, 1.25))
-        btn_9 = pm.button(label='1.5', w=33, bgc=self.rgb([215, 215, 215]),
-                          c=pm.Callback(self.update_slider, user_scale, 1.5))
-        btn_10 = pm.button(label='1.75', w=33, bgc=self.rgb([215, 215, 215]),
-                           c=pm.Callback(self.update_slider, user_scale, 1.75))
-        btn_11 = pm.button(label='x2', w=33, bgc=self.rgb([231, 205, 59]),
-                           c=pm.Callback(self.update_slider, user_scale, 2.0))
+        for label, amount, color in _PRESET_BUTTONS:
+            flags = {'bgc': color} if color else {}
+            pm.button(label=label, w=33, c=partial(self.update_slider, user_scale, amount), **flags)
 
 
         # headers
         pm.setParent(main_layout)
         pm.separator(style='none', h=5)
         categories = pm.rowColumnLayout(nc=3)
-        pm.text(label='Value', w=177, font='boldLabelFont', bgc=self.rgb([231, 205, 59]))
+        pm.text(label='Value', w=177, font='boldLabelFont', bgc=_COLOR_YELLOW)
         pm.separator(style='single', w=10)
-        pm.text(label='Time', w=179, font='boldLabelFont', bgc=self.rgb([20, 20, 20]))
+        pm.text(label='Time', w=179, font='boldLabelFont', bgc=_COLOR_BLACK)
         pm.separator(style='none', h=5)
         pm.separator(style='single', w=10)
         pm.separator(style='none', h=5)
@@ -293,80 +475,26 @@ class Window_UI:
         # pivot buttons
         pm.setParent('..')
         pivot_buttons = pm.rowColumnLayout(nc=5)
-        pb1 = pm.button(label='Mid', w=88, annotation='Scaled from midpoint value of curve',
-                        bgc=self.rgb([215, 215, 215]),
-                        command=pm.Callback(do_scale, 'pivot_middle_value', user_scale, 'scale_keys_value'))
-        pb2 = pm.button(label='Multi', w=89, annotation='Each curve scaled from its own midpoint',
-                        bgc=self.rgb([45, 45, 45]),
-                        command=pm.Callback(do_scale, 'pivot_middle_value', user_scale, 'scale_keys_value_multi'))
-        pm.separator(style='single', w=10)
-        pb3 = pm.button(label='First', w=87, annotation='Scaled from first frame of selection',
-                        bgc=self.rgb([120, 120, 120]),
-                        command=pm.Callback(do_scale, 'pivot_first_time', user_scale, 'scale_keys_time'))
-        pb4 = pm.button(label='Multi', w=88, annotation='Each curve scaled from its first frame',
-                        bgc=self.rgb([45, 45, 45]),
-                        command=pm.Callback(do_scale, 'pivot_first_time', user_scale, 'scale_keys_time_multi'))
-        pb5 = pm.button(label='Highest', w=87, annotation='Scaled from the highest key value selected',
-                        bgc=self.rgb([215, 215, 215]),
-                        command=pm.Callback(do_scale, 'pivot_highest_value', user_scale, 'scale_keys_value'))
-        pb6 = pm.button(label='Multi', w=88, annotation='Each curve scaled from its highest selected key',
-                        bgc=self.rgb([45, 45, 45]),
-                        command=pm.Callback(do_scale, 'pivot_highest_value', user_scale, 'scale_keys_value_multi'))
-        pm.separator(style='single', w=10)
-        pb7 = pm.button(label='Last', w=89, annotation='Scaled from last frame of selection',
-                        bgc=self.rgb([120, 120, 120]),
-                        command=pm.Callback(do_scale, 'pivot_last_time', user_scale, 'scale_keys_time'))
-        pb8 = pm.button(label='Multi', w=88, annotation='Each curve scaled from its last frame',
-                        bgc=self.rgb([45, 45, 45]),
-                        command=pm.Callback(do_scale, 'pivot_last_time', user_scale, 'scale_keys_time_multi'))
-        pb9 = pm.button(label='Lowest', w=87, annotation='Scaled from the lowest key value selected',
-                        bgc=self.rgb([215, 215, 215]),
-                        command=pm.Callback(do_scale, 'pivot_lowest_value', user_scale, 'scale_keys_value'))
-        pb10 = pm.button(label='Multi', w=88, annotation='Each curve scaled from its lowest selected key',
-                         bgc=self.rgb([45, 45, 45]),
-                         command=pm.Callback(do_scale, 'pivot_lowest_value', user_scale, 'scale_keys_value_multi'))
-        pm.separator(style='single', w=10)
-        pb11 = pm.button(label='Current', w=89, annotation='Scaled from the current frame in timerange',
-                         bgc=self.rgb([120, 120, 120]),
-                         command=pm.Callback(do_scale, 'pivot_current_time', user_scale, 'scale_keys_time'))
-        pm.separator(style='none')
-        pb12 = pm.button(label='0', w=87, annotation='Scaled from 0', bgc=self.rgb([215, 215, 215]),
-                         command=pm.Callback(do_scale, 'pivot_zero_value', user_scale, 'scale_keys_value'))
-        pm.separator(style='none')
-        pm.separator(style='single', w=10)
-        pb13 = pm.button(label='Last Selected', w=89, annotation='Scaled in time from the last selected key frame',
-                         bgc=self.rgb([120, 120, 120]),
-                         command=pm.Callback(do_scale, 'pivot_last_selected_time', user_scale, 'scale_keys_time'))
-        pm.separator(style='none')
-        pb14 = pm.button(label='Last Selected', w=87, annotation='Scaled in value from the last selected key',
-                         bgc=self.rgb([215, 215, 215]),
-                         command=pm.Callback(do_scale, 'pivot_last_selected_value', user_scale, 'scale_keys_value'))
-        pm.separator(style='none')
-        pm.separator(style='single', w=10)
-        pm.separator(style='in')
-        pm.separator(style='in')
-        pb15 = pm.button(label='First', w=87, annotation='Each curve selected from its earliest selected key',
-                         bgc=self.rgb([215, 215, 215]),
-                         command=pm.Callback(do_scale, 'pivot_first_value', user_scale, 'scale_keys_value_multi'))
-        pm.separator(style='none')
-        pm.separator(style='single', w=10)
-
-        pb16 = pm.button(label='Flip Mid', w=77, annotation='Flip each selected curve along its midpoint value',
-                         bgc=self.rgb([231, 205, 59]),
-                         command=pm.Callback(do_scale, 'pivot_flip_curve_value', user_scale, 'scale_keys_value_multi'))
+        for spec in _PIVOT_BUTTONS:
+            if isinstance(spec, dict):
+                pm.separator(**spec)
+                continue
 
-        pb17 = pm.button(label='Flip 0', w=77, annotation='Flip each selected curve over 0',
-                         bgc=self.rgb([231, 205, 59]),
-                         command=pm.Callback(do_scale, 'pivot_flip_zero_value', user_scale, 'scale_keys_value'))
+            label, width, annotation, color, pivot, scale_type = spec
+            pm.button(label=label, w=width, annotation=annotation, bgc=color,
+                      command=partial(do_scale, pivot, user_scale, scale_type))
 
         pm.setParent('..')
         pm.separator(h=10, style='in')
 
         pm.showWindow(tool_window)
+        _window_state['built'] = True
 
 
-w = Window_UI()
-w.build_ui()
+def show():
+    """Opens the scalist window, only building it if it isn't open already"""
+    w = Window_UI()
+    w.build_ui()
 
 
 